@@ -43,10 +43,11 @@ def get_mailclient(
     )
 
 
-@st.cache_data
+@st.cache_data(ttl=60)
 def get_emails():
     """
     Fetch the emails from the mail client.
+    The result is kept for a minute, so reruns do not query the mail server again.
 
     :return: The emails fetched from the mail client.
     """
@@ -60,4 +61,4 @@ def get_database():
 
     :return: The database instance.
     """
-    return cls.Database().get_instance()
+    return cls.Database.get_instance()
@@ -28,8 +28,7 @@ def configure_global_logger(
     formatter = logging.Formatter(logging_format)
 
     # Set and create the logging directory if it does not exist
-    if not os.path.exists(logging_directory):
-        os.makedirs(logging_directory)
+    os.makedirs(logging_directory, exist_ok=True)
 
     # File handler for writing logs to a file
     file_handler = logging.FileHandler(logging_directory + 'application.log')
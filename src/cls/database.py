@@ -99,6 +99,8 @@ class Database(Singleton):
                 ratio FLOAT
             );
             """)
+            # Index the BaFin-ID, since the companies are looked up by it
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_companies_bafin_id ON companies (bafin_id);")
             self._conn.commit()
             log.debug("Companies table created or already exists.")
         except sqlite3.Error as e:
@@ -124,6 +126,8 @@ class Database(Singleton):
                 FOREIGN KEY (company_id) REFERENCES companies(id)
             );
             """)
+            # Cover the submission counts, so they are read from the index instead of the table
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_status_status_company ON status (status, company_id);")
             self._conn.commit()
             log.debug("Status table created or already exists.")
         except sqlite3.Error as e:
@@ -134,8 +138,8 @@ class Database(Singleton):
         Insert data from a JSON file into the companies table.
         """
         try:
-            # Check if the table is empty
-            if not self.cursor.execute("SELECT COUNT(*) FROM companies").fetchone()[0] == 0:
+            # Check if the table is empty, stopping at the first row instead of counting all of them
+            if self.cursor.execute("SELECT 1 FROM companies LIMIT 1").fetchone():
                 log.debug("Company table already contains data, skipping example data insertion.")
                 return
 
@@ -177,33 +181,53 @@ class Database(Singleton):
         except Exception as e:
             log.error(f"Unexpected error: {e}")
 
-    def query(self, query: str) -> list[tuple]:
+    def query(self, query: str, params: tuple = ()) -> list[tuple]:
         """
         Execute a query on the database.
         The difference is that this method does not do a commit.
 
-        :param query: The query to execute.
+        :param query: The query to execute, using ? placeholders for values.
+        :param params: The values to bind to the placeholders of the query.
         :return: The result of the query as a list of tuples
         """
         try:
-            self.cursor.execute(query)
+            self.cursor.execute(query, params)
             return self.cursor.fetchall()
         except sqlite3.Error as e:
             log.error(f"Error executing query: {e}")
             return []
 
-    def insert(self, insert_query: str) -> bool:
+    def insert(self, insert_query: str, params: tuple = ()) -> bool:
         """
         Execute an insert query on the database.
         The difference is that this method does not do a fetchall.
 
-        :param insert_query: The insert query to execute.
+        :param insert_query: The insert query to execute, using ? placeholders for values.
+        :param params: The values to bind to the placeholders of the query.
         :return: True if the query was successful, False otherwise.
         """
         try:
-            self.cursor.execute(insert_query)
+            self.cursor.execute(insert_query, params)
             self._conn.commit()
             return True
         except sqlite3.Error as e:
             log.error(f"Error executing query: {e}")
             return False
+
+    def insert_many(self, insert_query: str, params: list[tuple]) -> bool:
+        """
+        Execute an insert query once for every set of parameters.
+        All rows are committed at once, or none of them if an error occurs.
+
+        :param insert_query: The insert query to execute, using ? placeholders for values.
+        :param params: The values to bind to the placeholders, one tuple per row.
+        :return: True if the query was successful, False otherwise.
+        """
+        try:
+            self.cursor.executemany(insert_query, params)
+            self._conn.commit()
+            return True
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            log.error(f"Error executing query: {e}")
+            return False
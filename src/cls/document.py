@@ -1,16 +1,9 @@
 """
 This module holds the document class.
 """
-import cv2
-import numpy as np
 import logging
-from pdf2image import convert_from_bytes
 import re
 
-# Custom imports
-import preprocessing.detect as dct
-from preprocessing.ocr import ocr_cell
-
 
 # Set up logging
 log  = logging.getLogger(__name__)
@@ -30,7 +23,7 @@ class Document:
         """
         self._content: bytes = content
         self._attributes: dict = attributes if attributes else {}
-        log.debug(f"Document created: {len(self._content)}, {len(self._attributes.keys())}")
+        log.debug("Document created: %s, %s", len(self._content), len(self._attributes.keys()))
 
     def __str__(self):
         string_form = (f"Document: of size {len(self._content)} bytes, with: {len(self._attributes.keys())} "
@@ -95,10 +88,17 @@ class Document:
         """
         Extract the text from the document.
         """
+        # Import the image processing libraries on first use, since only the extraction needs them
+        import cv2
+        import numpy as np
+        from pdf2image import convert_from_bytes
+        import preprocessing.detect as dct
+        from preprocessing.ocr import ocr_cell
+
         if self._content:
             # Convert the PDF document into a list of images (one image per page)
             images = convert_from_bytes(self._content)
-            log.debug(f"Number of pages in the document: {len(images)}")
+            log.debug("Number of pages in the document: %s", len(images))
 
             # Loop through each page of the document
             for i, image in enumerate(images):
@@ -115,11 +115,11 @@ class Document:
                 for j, contour in enumerate(table_contours):
                     x, y, w, h = cv2.boundingRect(contour)
                     table_roi = bgr_image[y:y + h, x:x + w]
-                    log.debug(f"Table {j + 1} on Page {i + 1}")
+                    log.debug("Table %s on Page %s", j + 1, i + 1)
 
                     # Detect rows in the table
                     rows = dct.rows(table_roi)
-                    log.debug(f"Number of rows detected: {len(rows)}")
+                    log.debug("Number of rows detected: %s", len(rows))
 
                     # Process each detected row
                     for k, (y1, y2) in enumerate(rows):
@@ -127,7 +127,7 @@ class Document:
 
                         # Crop the row from the table
                         row_image = table_roi[y1:y2, :]
-                        log.debug(f"Row {k + 1} on Page {i + 1}")
+                        log.debug("Row %s on Page %s", k + 1, i + 1)
 
                         # Detect cells in the row
                         cells = dct.cells(row_image)
@@ -142,7 +142,7 @@ class Document:
                             row_data.append(cell_text)
 
                         # Log and add the extracted row data to the attributes
-                        log.debug(f"Row {k + 1} Data: {row_data}")
+                        log.debug("Row %s Data: %s", k + 1, row_data)
 
                         # Three columns
                         if len(row_data) > 2:
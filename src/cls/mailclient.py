@@ -234,54 +234,116 @@ class Mailclient(Singleton):
         try:
             # Fetch the email
             _, msg_data = self._connection.fetch(email_id, '(RFC822)')
-            raw_email = msg_data[0][1]
-
-            # Parse the email
-            email_message = email.message_from_bytes(raw_email)
-
-            # List to store attachments in
-            attachments = []
-
-            # Walk through the email parts and look for attachments
-            for part in email_message.walk():
-                if part.get_content_maintype() == 'multipart':
-                    continue
-                if part.get('Content-Disposition') is None:
-                    continue
-
-                # Get the filename
-                filename = part.get_filename()
-                if not filename:
-                    continue
-
-                # Decode the filename
-                filename = decode_header(filename)[0][0]
-                if isinstance(filename, bytes):
-                    filename = filename.decode()
-
-                # Get the attachment data
-                attachment_data = part.get_payload(decode=True)
-
-                # Append the attachment to the list
-                attachments.append(Document(
-                    content=attachment_data,
-                    attributes={
-                        'filename': filename,
-                        'email_id': email_id,
-                        'content_type': part.get_content_type(),
-                        'sender': email_message['From'],
-                        # 'date': email_message['Date'],
-                    }
-                ))
-
-            if attachments:
-                log.info(f'Found {len(attachments)} attachments in custommail {email_id}')
-            else:
-                log.warning(f'No attachments found in custommail {email_id}')
-
-            # Return the attachments, if non are found list will be empty
-            return attachments
+            return self._parse_attachments(email_id, msg_data[0][1])
 
         except Exception as e:
             log.error(f"Error processing email {email_id}: {str(e)}")
             return []
+
+    def get_attachments_batch(self, email_ids: list) -> dict:
+        """
+        Method to get the attachments of multiple emails using a single fetch.
+        If the fetch fails, the emails are fetched one by one, so only the failing emails are missing.
+
+        :param email_ids: The ids of the emails to get the attachments from.
+        :return: A dictionary mapping each email id to its list of attachments.
+        """
+        if not email_ids:
+            return {}
+
+        try:
+            # Fetch all emails at once instead of issuing a round trip per email
+            _, msg_data = self._connection.fetch(self._message_set(email_ids), '(RFC822)')
+
+            # Each fetched email is returned as a tuple, starting with the id of the email
+            attachments = {}
+            for response_part in msg_data:
+                if isinstance(response_part, tuple):
+                    email_id = response_part[0].split()[0].decode(self._decoding_format)
+                    attachments[email_id] = self._parse_attachments(email_id, response_part[1])
+
+            return attachments
+
+        except Exception as e:
+            # A single bad id (e.g. an expunged email) fails the whole fetch, so fetch the emails one by one instead
+            log.warning(f"Error fetching emails {email_ids} at once, fetching them one by one: {str(e)}")
+            return {email_id: self.get_attachments(email_id) for email_id in email_ids}
+
+    @staticmethod
+    def _message_set(email_ids: list) -> str:
+        """
+        Method to build an imap message set from a list of email ids.
+        Consecutive ids are merged into ranges (e.g. 1,2,5:7), which keeps the fetch command short.
+
+        :param email_ids: The ids of the emails.
+        :return: The message set as a string.
+        """
+        ids = sorted({int(email_id) for email_id in email_ids})
+        ranges = []
+        start = end = ids[0]
+
+        for email_id in ids[1:]:
+            # Extend the current range as long as the ids are consecutive
+            if email_id == end + 1:
+                end = email_id
+                continue
+
+            ranges.append(str(start) if start == end else f'{start}:{end}')
+            start = end = email_id
+
+        ranges.append(str(start) if start == end else f'{start}:{end}')
+        return ','.join(ranges)
+
+    def _parse_attachments(self, email_id, raw_email: bytes) -> list:
+        """
+        Method to extract the attachments from a raw email.
+
+        :param email_id: The id of the email the attachments belong to.
+        :param raw_email: The raw content of the email.
+        :return: A list of attachments or an empty list if no attachments are found.
+        """
+        # Parse the email
+        email_message = email.message_from_bytes(raw_email)
+
+        # List to store attachments in
+        attachments = []
+
+        # Walk through the email parts and look for attachments
+        for part in email_message.walk():
+            if part.get_content_maintype() == 'multipart':
+                continue
+            if part.get('Content-Disposition') is None:
+                continue
+
+            # Get the filename
+            filename = part.get_filename()
+            if not filename:
+                continue
+
+            # Decode the filename
+            filename = decode_header(filename)[0][0]
+            if isinstance(filename, bytes):
+                filename = filename.decode()
+
+            # Get the attachment data
+            attachment_data = part.get_payload(decode=True)
+
+            # Append the attachment to the list
+            attachments.append(Document(
+                content=attachment_data,
+                attributes={
+                    'filename': filename,
+                    'email_id': email_id,
+                    'content_type': part.get_content_type(),
+                    'sender': email_message['From'],
+                    # 'date': email_message['Date'],
+                }
+            ))
+
+        if attachments:
+            log.info(f'Found {len(attachments)} attachments in custommail {email_id}')
+        else:
+            log.warning(f'No attachments found in custommail {email_id}')
+
+        # Return the attachments, if non are found list will be empty
+        return attachments
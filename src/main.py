@@ -54,13 +54,10 @@ def main():
     # Render the page based on the selected option
     match st.session_state.page:
         case 0:
-            log.debug('Home page selected')
             page.home()
         case 1:
-            log.debug('Settings page selected')
             page.settings()
         case 2:
-            log.debug('About page selected')
             page.about()
         case _:
             log.warning(f'Invalid page selected: {st.session_state.page}, defaulting to home page.')
@@ -69,7 +66,7 @@ def main():
 
     # Log end of script execution to track streamlit reruns
     st.session_state.rerun_counter += 1
-    log.debug(f'script executed {st.session_state.rerun_counter} times')
+    log.debug('script executed %s times, rendered page %s', st.session_state.rerun_counter, st.session_state.page)
     if st.session_state.rerun_counter % 5 == 0:
         log.info(f'script executed {st.session_state.rerun_counter} times')
 
@@ -18,7 +18,7 @@ def tables(bgr_image_array: np.array) -> List[np.array]:
     :return: A list of points representing the contours of the detected tables.
     """
     grey_bgr_image_array = cv2.cvtColor(bgr_image_array, cv2.COLOR_BGR2GRAY)
-    log.debug("Grey image shape:", grey_bgr_image_array.shape)
+    log.debug("Grey image shape: %s", grey_bgr_image_array.shape)
 
     # Create a binary threshold (basically splitting the image into two colors of maximum intensity)
     thresh = cv2.adaptiveThreshold(
@@ -29,26 +29,26 @@ def tables(bgr_image_array: np.array) -> List[np.array]:
         15,  # Size of the neighborhood considered for thresholding (should be an odd number)
         10   # A constant subtracted from the mean (adjusts sensitivity)
     )
-    log.debug("Thresholded image shape:", thresh.shape)
+    log.debug("Thresholded image shape: %s", thresh.shape)
 
     # Detect horizontal lines
     horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
     detect_horizontal = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
-    log.debug("Horizontal lines shape:", detect_horizontal.shape)
+    log.debug("Horizontal lines shape: %s", detect_horizontal.shape)
 
     # Detect vertical lines
     vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
     detect_vertical = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, vertical_kernel, iterations=2)
-    log.debug("Vertical lines shape:", detect_vertical.shape)
+    log.debug("Vertical lines shape: %s", detect_vertical.shape)
 
     # Combine horizontal and vertical lines to form a mask
     table_mask = cv2.addWeighted(detect_horizontal, 0.5, detect_vertical, 0.5, 0.0)
-    log.debug("Table mask shape:", table_mask.shape)
+    log.debug("Table mask shape: %s", table_mask.shape)
 
     # Find the contours of the mask and filter based on area size
     contours, _ = cv2.findContours(table_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     table_contours = [cnt for cnt in contours if cv2.contourArea(cnt) > 5000]
-    log.debug("Table contours:", table_contours)
+    log.debug("Table contours: %s", table_contours)
 
     return table_contours
 
@@ -65,33 +65,33 @@ def rows(bgr_image_array: np.array) -> List[Tuple[int, int]]:
     """
     table_rows = []
     grey_bgr_image_array = cv2.cvtColor(bgr_image_array, cv2.COLOR_BGR2GRAY)
-    log.debug("Grey image shape:", grey_bgr_image_array.shape)
+    log.debug("Grey image shape: %s", grey_bgr_image_array.shape)
 
     # Create a binary threshold
     _, thresh = cv2.threshold(grey_bgr_image_array, 240, 255, cv2.THRESH_BINARY_INV)
-    log.debug("Thresholded image shape:", thresh.shape)
+    log.debug("Thresholded image shape: %s", thresh.shape)
 
     # Detect horizontal lines (potential row separators)
     horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
     detect_horizontal = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
-    log.debug("Horizontal lines shape:", detect_horizontal.shape)
+    log.debug("Horizontal lines shape: %s", detect_horizontal.shape)
 
     # Find contours of horizontal lines
     contours, _ = cv2.findContours(detect_horizontal, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    log.debug("Contours:", contours)
+    log.debug("Contours: %s", contours)
 
     # Sort contours by y-coordinate of the bounding rectangle (top-left corner)
     contours = sorted(contours, key=lambda c: cv2.boundingRect(c)[1])
-    log.debug("Sorted contours:", contours)
+    log.debug("Sorted contours: %s", contours)
 
     # Extract row coordinates from the contours (y-coordinate of the bounding rectangle)
     for i in range(len(contours) - 1):
         y1 = cv2.boundingRect(contours[i])[1]
         y2 = cv2.boundingRect(contours[i + 1])[1]
         table_rows.append((y1, y2))
-        log.debug("Row coordinates:", (y1, y2))
+        log.debug("Row coordinates: %s", (y1, y2))
 
-    log.debug("Table rows:", table_rows)
+    log.debug("Table rows: %s", table_rows)
 
     return table_rows
 
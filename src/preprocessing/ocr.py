@@ -13,5 +13,5 @@ def ocr_cell(cell_image):
     log.debug('Converted cell image to PIL Image')
     # Perform OCR
     text = pytesseract.image_to_string(pil_image)  # , config='--psm 6'
-    log.debug(f'Extracted text from cell: {text}')
+    log.debug('Extracted text from cell: %s', text)
     return text.strip()
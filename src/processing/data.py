@@ -6,7 +6,30 @@ import re
 
 # Custom imports
 from cfg.cache import get_database
-from cls import Document
+from cls import Document, Database
+
+
+# Markers identifying the document fields, in the order of the compared companies columns
+_COMPARED_FIELDS = (
+    "033", "034", "035", "036",
+    "Nr. 1", "Nr. 2", "Nr. 3", "Nr. 4", "Nr. 5",
+    "Nr. 6", "Nr. 7", "Nr. 8", "Nr. 9", "Nr. 10",
+)
+
+# Position of each field marker within the compared database values
+_FIELD_POSITIONS = {marker: position for position, marker in enumerate(_COMPARED_FIELDS)}
+
+# Pattern extracting the field marker (position number or "Nr." number) from a document key
+_FIELD_MARKER = re.compile(r'(03[3-6])|Nr\. (\d+)')
+
+# Columns of a company row used for the comparison, the id followed by the compared values
+_COMPANY_COLUMNS = """
+    id,
+    p033, p034, p035, p036,
+    ab2s1n01, ab2s1n02, ab2s1n03, ab2s1n04,
+    ab2s1n05, ab2s1n06, ab2s1n07, ab2s1n08,
+    ab2s1n09, ab2s1n10
+"""
 
 
 def initialize_company_status(company_document: Document):
@@ -20,12 +43,32 @@ def initialize_company_status(company_document: Document):
             db = get_database()
             bafin_id = bafin_id.group()
 
-            company = db.query(f"SELECT * FROM companies WHERE bafin_id = {bafin_id}")
+            company = db.query("SELECT * FROM companies WHERE bafin_id = ? LIMIT 1", (bafin_id,))
 
             # TODO: Implement the initialize_company_status function
 
 
-def compare_company_values(company_document: Document):
+def load_company_rows(database: Database = None) -> dict:
+    """
+    This function loads the rows of all companies used for the comparison at once.
+
+    :param database: The database to use, fetched from the cache if not provided.
+    :return: A dictionary mapping each BaFin-ID to the row of the company (the id followed by the compared values).
+    """
+    db = database if database else get_database()
+    return {row[0]: row[1:] for row in db.query(f"SELECT bafin_id, {_COMPANY_COLUMNS} FROM companies")}
+
+
+def compare_company_values(company_document: Document, database: Database = None, company_row: tuple = None):
+    """
+    This function compares the values extracted from a document with the values of the company in the database.
+    "Nr. 11" (ab2s1n11) is not compared.
+
+    :param company_document: The document holding the extracted values.
+    :param database: The database to use, fetched from the cache if not provided.
+    :param company_row: The row of the company (see load_company_rows), queried from the database if not provided.
+    :return: True if all values match the database, False otherwise.
+    """
     bafin_id = company_document.get_attributes("BaFin-ID")
 
     if bafin_id:
@@ -33,24 +76,22 @@ def compare_company_values(company_document: Document):
         bafin_id = re.search(r'\b\d{8}\b', bafin_id)
 
         if bafin_id:
-            db = get_database()
             bafin_id = bafin_id.group()
 
-            company_data = db.query(f"""
-            SELECT 
-                id,
-                p033, p034, p035, p036,
-                ab2s1n01, ab2s1n02, ab2s1n03, ab2s1n04, 
-                ab2s1n05, ab2s1n06, ab2s1n07, ab2s1n08, 
-                ab2s1n09, ab2s1n10, ab2s1n11
-            FROM companies 
-            WHERE bafin_id = {bafin_id}
-            """)
-
-            if len(company_data) > 0:
-                log.debug(f"Company with BaFin ID {bafin_id} found in database")
+            # Query the company only if its row wasn't loaded beforehand
+            if company_row is None:
+                db = database if database else get_database()
+                company_data = db.query(f"SELECT {_COMPANY_COLUMNS} FROM companies WHERE bafin_id = ? LIMIT 1",
+                                        (bafin_id,))
+                company_row = company_data[0] if company_data else None
+
+            if company_row:
+                log.debug("Company with BaFin ID %s found in database", bafin_id)
                 document_attributes = company_document.get_attributes()
 
+                # Database values in the same order as the field markers (skipping the id column)
+                db_values = company_row[1:]
+
                 # TODO: Implement a proper way to compare the values
                 for key in document_attributes.keys():
                     try:
@@ -58,68 +99,17 @@ def compare_company_values(company_document: Document):
                     except ValueError:
                         continue
 
-                    if "033" in key:
-                        if company_data[0][1] != value:
-                            log.debug(f"db: {type(company_data[0][1])} vs doc: {type(value)}")
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][1]} (database) vs {value} (document)")
-                            return False
-                    elif "034" in key:
-                        if company_data[0][2] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][2]} (database) vs {value} (document)")
-                            return False
-                    elif "035" in key:
-                        if company_data[0][3] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][3]} (database) vs {value} (document)")
-                            return False
-                    elif "036" in key:
-                        if company_data[0][4] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][4]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 1" in key:
-                        if company_data[0][5] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][5]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 2" in key:
-                        if company_data[0][6] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][6]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 3" in key:
-                        if company_data[0][7] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][7]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 4" in key:
-                        if company_data[0][8] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][8]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 5" in key:
-                        if company_data[0][9] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][9]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 6" in key:
-                        if company_data[0][10] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][10]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 7" in key:
-                        if company_data[0][11] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][11]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 8" in key:
-                        if company_data[0][12] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][12]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 9" in key:
-                        if company_data[0][13] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][13]} (database) vs {value} (document)")
-                            return False
-                    elif "Nr. 10" in key:
-                        if company_data[0][14] != value:
-                            log.debug(f"Value mismatch for key {key}: {company_data[0][14]} (database) vs {value} (document)")
-                            return False
-                    #elif "Nr. 11" in key:
-                    #    if company_data[0][15] != float(value.replace(".", "").replace(",", ".")):
-                    #        log.debug(f"Value mismatch for key {key}: {company_data[0][15]} (database) vs {value} (
-                            #        document)")
-                    #        return False
+                    # Look up the database value for the field marker found in the key
+                    marker = _FIELD_MARKER.search(key)
+                    if not marker:
+                        continue
+                    position = _FIELD_POSITIONS.get(marker.group(1) or f"Nr. {int(marker.group(2))}")
+                    if position is None:
+                        continue
+
+                    if db_values[position] != value:
+                        log.debug("Value mismatch for key %s: %s (database) vs %s (document)", key, db_values[position], value)
+                        return False
 
                 # Return True if all conditions are met and no mismatches are found
                 log.info(f"Values for company with BaFin ID {bafin_id} match the database.")
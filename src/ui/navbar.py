@@ -6,14 +6,22 @@ import logging as log
 # Custom imports
 
 
+# Label and page number of each navigation button
+NAV_ITEMS = (
+    ('Home', 0),
+    ('Settings', 1),
+    ('About', 2),
+)
+
+
 def navbar() -> int:
     """
     This is the sidebar ui page for the application.
 
     :return: The selected page number.
     """
-    # Initialize the page number
-    page = 0
+    # Keep the previously selected page, defaulting to the home page
+    page = streamlit.session_state.setdefault('page', 0)
 
     # Set the sidebar to st for easier access and to make sure everything happens
     # inside the sidebar unless explicitly stated
@@ -23,18 +31,12 @@ def navbar() -> int:
     st.title('Navigation')
     st.write('Please select an option from the list below.')
 
-    # Buttons
-    if st.button('Home'):
-        log.debug('Fetch Documents button clicked')
-        page = 0
-
-    if st.button('Settings'):
-        log.debug('Settings button clicked')
-        page = 1
-
-    if st.button('About'):
-        log.debug('About button clicked')
-        page = 2  # TODO: Change to 3 when the about page is implemented
+    # Buttons (grouped in a single container and bound once, since they are rendered on every rerun)
+    button = st.container().button
+    for label, page_number in NAV_ITEMS:
+        if button(label):
+            log.debug('%s button clicked', label)
+            page = page_number
 
     if st.button('Exit'):
         log.debug('Exit button clicked')
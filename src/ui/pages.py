@@ -2,29 +2,34 @@
 This module holds the main ui page for the application.
 """
 import os
+import re
 import streamlit as st
 import logging as log
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Custom imports
 import ui.visuals as visuals
 import cfg.cache as cache
 import processing.data as process
 
+# Number of mails shown per page of the mail table
+EMAIL_PAGE_SIZE = 200
+
 
 def home():
     """
     This is the main ui page for the application.
     It serves as a landing page and provides the user with options to navigate the application.
     """
-    log.debug('Rendering home page')
-
     # Page title and description
-    st.header('Document Fetcher')
-    st.write('Welcome to the Document Fetcher application!')
+    st.markdown('## Document Fetcher\nWelcome to the Document Fetcher application!')
 
-    # Fetch the emails and client
+    # Drop the cached emails so they are fetched from the mail server again
+    if st.button('Refresh emails'):
+        cache.get_emails.clear()
+
+    # Fetch the emails
     emails = cache.get_emails()
-    mailclient = cache.get_mailclient()
 
     # Configure layout
     column_left, column_right = st.columns(2)
@@ -32,89 +37,204 @@ def home():
     # Display a plot on the right
     with column_left:
         # Pie chart showing the submission ratio
-        st.pyplot(visuals.pie_submission_ratio())
+        st.image(visuals.pie_submission_ratio(visuals.submission_counts()))
         # TODO: Fix issue with labels overlapping
 
     # Display a table on the left
     with column_right:
-        # Display the mails
-        st.dataframe(emails)
+        # Display the mails a page at a time, so large inboxes aren't sent to the browser at once
+        pages = max(1, (len(emails) - 1) // EMAIL_PAGE_SIZE + 1)
+        page = st.number_input('Page', min_value=1, max_value=pages, value=1) if pages > 1 else 1
+        st.dataframe(emails.iloc[(page - 1) * EMAIL_PAGE_SIZE:page * EMAIL_PAGE_SIZE])
+
+    # Display the document selection and processing
+    _document_processing(emails)
+
+
+@st.fragment
+def _document_processing(emails):
+    """
+    This renders the document selection and processes the selected documents.
+    It runs as a fragment, so submitting the selection only reruns this block instead of the whole page.
 
-    # Display a multiselect box to select documents to process
-    docs_to_process = st.multiselect('Select documents to process',emails['ID'])
+    :param emails: The emails fetched from the mail client.
+    """
+    # Collect the selection in a form, so changing it doesn't trigger a rerun until it is submitted
+    with st.form('document_processing'):
+        # Display a multiselect box to select documents to process
+        docs_to_process = st.multiselect('Select documents to process',emails['ID'])
+        submitted = st.form_submit_button('Process selected documents')
 
     # Process the selected documents
-    if st.button('Process selected documents'):
-        log.debug('Processing selected documents...')
-
-        # Iterate over the selected documents
-        for mail_id in docs_to_process:
-            log.debug(f'Processing mail with ID {mail_id}')
-            attachments = mailclient.get_attachments(mail_id)
-
-            # Check if attachments are present
-            if not attachments:
-                log.warning(f'No attachments found for mail with ID {mail_id}')
-                st.error(f'No attachments found for mail with ID {mail_id}')
+    if submitted and not docs_to_process:
+        st.info('Select at least one document to process.')
+    elif submitted:
+        # Rerun the whole page once after processing, so the chart reflects the new status entries
+        if _process_documents(docs_to_process):
+            st.rerun()
+
+
+def _process_documents(mail_ids: list) -> int:
+    """
+    This processes the pdf attachments of the given mails and stores their status in the database.
+    All mails are handled in a single call, so the attachments are fetched and the status is written only once.
+
+    Messages are shown as toasts, so they remain visible if the page is rerun afterwards.
+
+    :param mail_ids: The ids of the mails to process.
+    :return: The number of status entries written to the database.
+    """
+    log.debug('Processing %s selected documents...', len(mail_ids))
+    mailclient = cache.get_mailclient()
+
+    # Fetch the attachments of all selected documents at once
+    attachments_by_mail = mailclient.get_attachments_batch(mail_ids)
+
+    # Collect the pdf attachments of the selected documents
+    documents = []
+    for mail_id in mail_ids:
+        attachments = attachments_by_mail.get(mail_id, [])
+
+        # Check if attachments are present
+        if not attachments:
+            log.warning(f'No attachments found for mail with ID {mail_id}')
+            st.toast(f'No attachments found for mail with ID {mail_id}', icon='🚨')
+            continue
+        elif len(attachments) > 1:
+            log.warning(f'Mail with ID {mail_id} has {len(attachments)} attachments, processing all of them.')
+            st.toast(f'Mail with ID {mail_id} has {len(attachments)} attachments, processing all of them.', icon='⚠️')
+
+        for attachment in attachments:
+            if attachment.get_attributes('content_type') == 'application/pdf':
+                documents.append((mail_id, attachment))
+            else:
+                log.info('Skipping non-pdf attachment %s', attachment.get_attributes('content_type'))
+
+    # Load the companies once instead of querying them per attachment
+    db = cache.get_database()
+    company_rows = process.load_company_rows(db)
+
+    # Status entries of the processed documents, written at once after processing
+    status_entries = []
+    processed = 0
+
+    # Show the progress without rerunning the script
+    progress = st.progress(0.0, text='Processing documents...')
+
+    # Extract the table data of the documents in parallel, since the work is mostly done by external
+    # processes (poppler and tesseract), while the results are checked in the script thread
+    with ThreadPoolExecutor(max_workers=_worker_count()) as executor:
+        futures = {executor.submit(attachment.extract_table_data): (mail_id, attachment)
+                   for mail_id, attachment in documents}
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            mail_id, attachment = futures[future]
+            progress.progress(done / len(futures), text=f'Processed document {done} of {len(futures)}')
+
+            try:
+                future.result()
+                processed += 1
+                log.info('Processed pdf attachment %s of mail %s', attachment.get_attributes('filename'), mail_id)
+            except Exception as e:
+                log.error(f'Error extracting data from attachment of mail with ID {mail_id}: {e}')
+                st.toast(f'Could not process the attachment of mail with ID {mail_id}', icon='🚨')
                 continue
-            elif len(attachments) > 1:
-                log.warning(f'Mail with ID {mail_id} has {len(attachments)} attachments, processing all of them.')
-                st.warning(f'Mail with ID {mail_id} has {len(attachments)} attachments, processing all of them.')
-
-                for attachment in attachments:
-                    if attachment.get_attributes('content_type') == 'application/pdf':
-                        log.info(f'Processing pdf attachment {attachment.get_attributes("filename")}')
-
-                        # Extract text from the document
-                        attachment.extract_table_data()
-
-                        # Get the database
-                        db = cache.get_database()
-
-                        # Get the company id based on the BaFin-ID
-                        company_id = db.query(f"""
-                            SELECT id 
-                            FROM companies 
-                            WHERE bafin_id ={attachment.get_attributes('BaFin-ID')}
-                            """)
-
-                        # Check if all values match the database
-                        if process.compare_company_values(attachment):
-                            # TODO: Create a status column once the documents are getting processed (and simply update
-                            #  it later on)
-
-                            db.insert(f"""
-                            INSERT INTO status (company_id, email_id, status)
-                            VALUES ({company_id[0][0]}, {mail_id}, 'processed')
-                            """)
-
-                            log.info(f"Company with BaFin ID {attachment.get_attributes('BaFin-ID')} successfully processed")
-                        else:
-                            if len(company_id[0][0]) == 0:
-                                db.insert(f"""
-                                INSERT INTO status (company_id, email_id, status)
-                                VALUES ({company_id[0][0]}, {mail_id}, 'processing')
-                                """)
-                            else:
-                                log.info(f"Couldn't detect BaFin-ID for document with mail id: {mail_id}")
-                    else:
-                        log.info(f'Skipping non-pdf attachment {attachment.get_attributes("content_type")}')
+
+            # Get the company based on the BaFin-ID
+            bafin_id = attachment.get_attributes('BaFin-ID')
+            # The detected value may hold noise from the ocr, so only use the eight digit number in it
+            bafin_match = re.search(r'\b\d{8}\b', bafin_id) if bafin_id else None
+            company_row = company_rows.get(int(bafin_match.group())) if bafin_match else None
+
+            # TODO: Create a status column once the documents are getting processed (and simply update
+            #  it later on)
+            if company_row is None:
+                log.info(f"Couldn't detect BaFin-ID for document with mail id: {mail_id}")
+            # Check if all values match the database
+            elif process.compare_company_values(attachment, db, company_row):
+                status_entries.append((company_row[0], mail_id, 'processed'))
+                log.info(f"Company with BaFin ID {bafin_id} successfully processed")
+            else:
+                status_entries.append((company_row[0], mail_id, 'processing'))
+
+    # Write the status of all processed documents at once
+    if status_entries:
+        db.insert_many("INSERT INTO status (company_id, email_id, status) VALUES (?, ?, ?)", status_entries)
+        visuals.submission_counts.clear()
+
+    progress.progress(1.0, text='Processing finished')
+    st.toast(f'Processed {processed} documents, {len(status_entries)} of them matched a company')
+    return len(status_entries)
+
+
+def _worker_count() -> int:
+    """
+    Get the number of workers used to process the documents.
+    Each worker occupies a core with its external processes, so more workers than cores only add contention.
+
+    :return: The value of MAIL_WORKERS if it is a positive number, otherwise the number of cores (at most 4).
+    """
+    default = min(os.cpu_count() or 1, 4)
+
+    try:
+        workers = int(os.getenv('MAIL_WORKERS') or default)
+    except ValueError:
+        log.warning('Invalid MAIL_WORKERS value %s, using %s workers', os.getenv('MAIL_WORKERS'), default)
+        return default
+
+    return workers if workers > 0 else default
+
 
 def settings():
     """
     This is the settings ui page for the application.
     """
-    log.debug('Rendering settings page')
-
     # Page title and description
-    st.header('Settings')
-    st.write('Configure the application settings below.')
+    st.markdown('## Settings\nConfigure the application settings below.')
 
 
 def about():
     """
     This is the about ui page for the application.
     """
-    # Display the contents of the log file in a code block (as a placeholder)
-    with open(os.path.join(os.getenv('LOG_PATH', ''), 'application.log'), 'r') as file:
-        st.code(file.read())
+    log_path = os.path.join(os.getenv('LOG_PATH', ''), 'application.log')
+
+    try:
+        log_stat = os.stat(log_path)
+    except OSError:
+        st.warning('No log file found.')
+        return
+
+    # The tail is cached, so changing the number of lines only slices the lines already read
+    lines = st.slider('Number of log lines', min_value=10, max_value=300, value=100, step=10)
+
+    # Display the end of the log file in a code block (as a placeholder)
+    st.code('\n'.join(_tail_log(log_path, log_stat.st_size, log_stat.st_mtime)[-lines:]))
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _tail_log(path: str, size: int, modified: float, lines: int = 300, block_size: int = 8192) -> list:
+    """
+    Read the last lines of a log file without loading the whole file.
+    The file is read backwards in blocks until enough lines are found.
+    The size and modification time are part of the cache key, so a changed or rotated file is read again right away.
+
+    :param path: The path of the log file.
+    :param size: The size of the log file in bytes.
+    :param modified: The modification time of the log file.
+    :param lines: The number of lines to return.
+    :param block_size: The number of bytes to read per step.
+    :return: The last lines of the log file, without line breaks.
+    """
+    with open(path, 'rb') as file:
+        position = file.seek(0, os.SEEK_END)
+        data = b''
+
+        # One more line break than lines is needed, since the last line ends with one as well
+        while position > 0 and data.count(b'\n') <= lines:
+            step = min(block_size, position)
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+
+    return data.decode('utf-8', 'replace').splitlines()[-lines:]
@@ -1,55 +1,66 @@
 """
 This module contains functions for generating visuals.
 """
+import io
 import matplotlib.pyplot as plt
+import streamlit as st
 
 # Custom imports
 from cfg.cache import get_database
 
 
-def pie_submission_ratio() -> plt.Figure:
+@st.cache_data(ttl=60, show_spinner=False)
+def submission_counts() -> tuple:
     """
-    This function generates a pie chart showing the ratio of companies that have already submitted something.
+    This function counts the companies by their submission status.
+    The counts are kept for a minute and cleared whenever new submissions are recorded.
 
-    :return: The plot as a matplotlib figure.
+    :return: The number of companies processed successfully, in progress and without submission.
     """
-    db = get_database()
-
-    cmp_processed = db.query("""
-    SELECT COUNT(DISTINCT company_id)
+    # Count all statuses in a single pass over the status table
+    cmp_processed, cmp_processing, cmp_total = get_database().query("""
+    SELECT
+        COUNT(DISTINCT CASE WHEN status = 'processed' THEN company_id END),
+        COUNT(DISTINCT CASE WHEN status = 'processing' THEN company_id END),
+        (SELECT COUNT(DISTINCT id) FROM companies)
     FROM status
-    WHERE status = 'processed'
-    """)[0][0]
+    """)[0]
+    cmp_no_submission = cmp_total - cmp_processed - cmp_processing
 
-    cmp_processing = db.query("""
-    SELECT COUNT(DISTINCT company_id)
-    FROM status
-    WHERE status = 'processing'
-    """)[0][0]
+    return cmp_processed, cmp_processing, cmp_no_submission
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def pie_submission_ratio(counts: tuple) -> bytes:
+    """
+    This function generates a pie chart showing the ratio of companies that have already submitted something.
+    The chart is cached as a rendered png and only rebuilt once the counts change.
 
-    cmp_no_submission = db.query("""
-    SELECT COUNT(DISTINCT id)
-    FROM companies
-    """)[0][0] - cmp_processed - cmp_processing
+    :param counts: The submission counts (see submission_counts) to plot.
+    :return: The plot as png image.
+    """
+    cmp_processed, cmp_processing, cmp_no_submission = counts
 
     # Check if there is no data
     if cmp_processed == 0 and cmp_processing == 0 and cmp_no_submission == 0:
-        # Create a pie chart
+        # Show a placeholder slice
         labels = ['No data']
         sizes = [1]
         colors = ['gray']
-        fig, ax = plt.subplots()
-        ax.pie(sizes, labels=labels, colors=colors)
-        ax.axis('equal')
-        return fig
+    else:
+        # Show the submission ratio
+        labels = ['Processed successfully', 'In progress','No submission']
+        sizes = [cmp_processed, cmp_processing, cmp_no_submission]
+        colors = ['green', 'yellow', 'red']
 
     # Create a pie chart
-    labels = ['Processed successfully', 'In progress','No submission']
-    sizes = [cmp_processed, cmp_processing, cmp_no_submission]
-    colors = ['green', 'yellow', 'red']
-
     fig, ax = plt.subplots()
     ax.pie(sizes, labels=labels, colors=colors)
     ax.axis('equal')
 
-    return fig
+    # Render the figure once and close it, so it isn't kept open by pyplot
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100)
+    plt.close(fig)
+
+    return buffer.getvalue()